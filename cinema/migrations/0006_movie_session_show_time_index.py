@@ -0,0 +1,17 @@
+# Generated by Django 4.1 on 2026-10-15 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0005_ticket_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='moviesession',
+            index=models.Index(fields=['show_time'], name='cinema_movi_show_ti_234542_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1 on 2026-10-15 09:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cinema', '0006_movie_session_show_time_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', '-created_at'], name='cinema_orde_user_id_067d3d_idx'),
+        ),
+    ]
@@ -1,6 +1,18 @@
+from collections import defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
 from rest_framework import serializers
 
-from cinema.models import Genre, Actor, CinemaHall, Movie, MovieSession
+from cinema.models import (
+    Genre,
+    Actor,
+    CinemaHall,
+    Movie,
+    MovieSession,
+    Ticket,
+    Order,
+)
 
 
 class GenreSerializer(serializers.ModelSerializer):
@@ -59,6 +71,7 @@ class MovieSessionListSerializer(MovieSessionSerializer):
     cinema_hall_capacity = serializers.IntegerField(
         source="cinema_hall.capacity", read_only=True
     )
+    tickets_available = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = MovieSession
@@ -68,13 +81,145 @@ class MovieSessionListSerializer(MovieSessionSerializer):
             "movie_title",
             "cinema_hall_name",
             "cinema_hall_capacity",
+            "tickets_available",
         )
 
 
 class MovieSessionDetailSerializer(MovieSessionSerializer):
     movie = MovieListSerializer(many=False, read_only=True)
     cinema_hall = CinemaHallSerializer(many=False, read_only=True)
+    taken_places = serializers.JSONField(read_only=True)
 
     class Meta:
         model = MovieSession
-        fields = ("id", "show_time", "movie", "cinema_hall")
+        fields = ("id", "show_time", "movie", "cinema_hall", "taken_places")
+
+
+class TicketSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Ticket
+        fields = ("id", "row", "seat", "movie_session")
+        validators = []
+        extra_kwargs = {
+            "movie_session": {
+                "queryset": MovieSession.objects.select_related("cinema_hall")
+            }
+        }
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        Ticket.validate_ticket(
+            attrs["row"],
+            attrs["seat"],
+            attrs["movie_session"].cinema_hall,
+            serializers.ValidationError,
+        )
+        return data
+
+
+class OrderSerializer(serializers.ModelSerializer):
+    tickets = TicketSerializer(many=True, read_only=False, allow_empty=False)
+
+    class Meta:
+        model = Order
+        fields = ("id", "tickets", "created_at")
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        places = [
+            (ticket["movie_session"].id, ticket["row"], ticket["seat"])
+            for ticket in attrs["tickets"]
+        ]
+        if len(set(places)) != len(places):
+            raise serializers.ValidationError(
+                {"tickets": "The same seat can't be ordered twice."}
+            )
+
+        taken_places = set(
+            Ticket.objects.filter(
+                movie_session_id__in={place[0] for place in places},
+                row__in={place[1] for place in places},
+                seat__in={place[2] for place in places},
+            ).values_list("movie_session_id", "row", "seat")
+        )
+        conflicts = [place for place in places if place in taken_places]
+        if conflicts:
+            raise serializers.ValidationError(
+                {
+                    "tickets": [
+                        f"Seat (row: {row}, seat: {seat}) is already taken "
+                        f"for movie session {movie_session_id}."
+                        for movie_session_id, row, seat in conflicts
+                    ]
+                }
+            )
+        return data
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            tickets_data = validated_data.pop("tickets")
+            order = Order.objects.create(**validated_data)
+            try:
+                Ticket.objects.bulk_create(
+                    [
+                        Ticket(order=order, **ticket_data)
+                        for ticket_data in tickets_data
+                    ]
+                )
+            except IntegrityError:
+                raise serializers.ValidationError(
+                    {"tickets": "Some of the selected seats were just taken."}
+                )
+            return order
+
+
+def orders_serialize(orders):
+    datetime_field = serializers.DateTimeField()
+    tickets = (
+        Ticket.objects.filter(order_id__in=[order.id for order in orders])
+        .order_by("id")
+        .values(
+            "id",
+            "order_id",
+            "row",
+            "seat",
+            "movie_session_id",
+            "movie_session__show_time",
+            "movie_session__movie__title",
+            "movie_session__cinema_hall__name",
+            cinema_hall_capacity=(
+                F("movie_session__cinema_hall__rows")
+                * F("movie_session__cinema_hall__seats_in_row")
+            ),
+        )
+    )
+
+    tickets_by_order = defaultdict(list)
+    for ticket in tickets:
+        tickets_by_order[ticket["order_id"]].append(
+            {
+                "id": ticket["id"],
+                "row": ticket["row"],
+                "seat": ticket["seat"],
+                "movie_session": {
+                    "id": ticket["movie_session_id"],
+                    "show_time": datetime_field.to_representation(
+                        ticket["movie_session__show_time"]
+                    ),
+                    "movie_title": ticket["movie_session__movie__title"],
+                    "cinema_hall_name": ticket[
+                        "movie_session__cinema_hall__name"
+                    ],
+                    "cinema_hall_capacity": ticket["cinema_hall_capacity"],
+                },
+            }
+        )
+
+    return [
+        {
+            "id": order.id,
+            "tickets": tickets_by_order[order.id],
+            "created_at": datetime_field.to_representation(order.created_at),
+        }
+        for order in orders
+    ]
@@ -39,33 +39,53 @@ class MovieApiTests(TestCase):
         print(movies.data)
         self.assertEqual(movies.status_code, status.HTTP_200_OK)
         for field in titanic:
-            self.assertEqual(movies.data[0][field], titanic[field])
+            self.assertEqual(movies.data["results"][0][field], titanic[field])
 
     def test_get_movies_with_genres_filtering(self):
         movies = self.client.get(
             f"/api/cinema/movies/?genres={self.comedy.id}"
         )
-        self.assertEqual(len(movies.data), 1)
+        self.assertEqual(movies.data["count"], 1)
         movies = self.client.get(
             f"/api/cinema/movies/?genres={self.comedy.id},2,3"
         )
-        self.assertEqual(len(movies.data), 1)
+        self.assertEqual(movies.data["count"], 1)
         movies = self.client.get("/api/cinema/movies/?genres=123213")
-        self.assertEqual(len(movies.data), 0)
+        self.assertEqual(movies.data["count"], 0)
+        movies = self.client.get(
+            f"/api/cinema/movies/?genres={self.drama.id},{self.comedy.id}"
+        )
+        self.assertEqual(movies.data["count"], 1)
+        self.assertEqual(len(movies.data["results"]), 1)
 
     def test_get_movies_with_actors_filtering(self):
         movies = self.client.get(
             f"/api/cinema/movies/?actors={self.actress.id}"
         )
-        self.assertEqual(len(movies.data), 1)
+        self.assertEqual(movies.data["count"], 1)
         movies = self.client.get(f"/api/cinema/movies/?actors={123}")
-        self.assertEqual(len(movies.data), 0)
+        self.assertEqual(movies.data["count"], 0)
+        actor = Actor.objects.create(
+            first_name="Leonardo", last_name="Dicaprio"
+        )
+        self.movie.actors.add(actor)
+        movies = self.client.get(
+            f"/api/cinema/movies/?actors={self.actress.id},{actor.id}"
+        )
+        self.assertEqual(movies.data["count"], 1)
+        self.assertEqual(len(movies.data["results"]), 1)
+
+    def test_get_movies_with_invalid_ids_filtering(self):
+        movies = self.client.get("/api/cinema/movies/?actors=abc")
+        self.assertEqual(movies.status_code, status.HTTP_400_BAD_REQUEST)
+        movies = self.client.get("/api/cinema/movies/?genres=1,x")
+        self.assertEqual(movies.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_get_movies_with_title_filtering(self):
         movies = self.client.get(f"/api/cinema/movies/?title=ita")
-        self.assertEqual(len(movies.data), 1)
+        self.assertEqual(movies.data["count"], 1)
         movies = self.client.get(f"/api/cinema/movies/?title=ati")
-        self.assertEqual(len(movies.data), 0)
+        self.assertEqual(movies.data["count"], 0)
 
     def test_post_movies(self):
         movies = self.client.post(
@@ -153,3 +173,26 @@ class MovieApiTests(TestCase):
             "/api/cinema/movies/1000/",
         )
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_movies_num_queries(self):
+        movie = Movie.objects.create(
+            title="Avatar", description="Avatar description", duration=162
+        )
+        movie.genres.add(self.drama)
+        movie.actors.add(self.actress)
+        # count, movies, prefetched genres, prefetched actors
+        with self.assertNumQueries(4):
+            self.client.get("/api/cinema/movies/")
+
+    def test_get_movie_num_queries(self):
+        # movie, prefetched genres, prefetched actors
+        with self.assertNumQueries(3):
+            self.client.get(f"/api/cinema/movies/{self.movie.id}/")
+
+    def test_delete_movie_num_queries(self):
+        # movie, cascaded sessions, genres/actors links, movie delete
+        with self.assertNumQueries(5):
+            response = self.client.delete(
+                f"/api/cinema/movies/{self.movie.id}/"
+            )
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
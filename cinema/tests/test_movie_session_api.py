@@ -52,7 +52,7 @@ class MovieSessionApiTests(TestCase):
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
         for field in movie_session:
             self.assertEqual(
-                movie_sessions.data[0][field], movie_session[field]
+                movie_sessions.data["results"][0][field], movie_session[field]
             )
 
     def test_get_movie_sessions_filtered_by_date(self):
@@ -60,45 +60,45 @@ class MovieSessionApiTests(TestCase):
             "/api/cinema/movie_sessions/?date=2022-09-02"
         )
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(movie_sessions.data), 1)
+        self.assertEqual(movie_sessions.data["count"], 1)
 
         movie_sessions = self.client.get(
             "/api/cinema/movie_sessions/?date=2022-09-01"
         )
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(movie_sessions.data), 0)
+        self.assertEqual(movie_sessions.data["count"], 0)
 
     def test_get_movie_sessions_filtered_by_movie(self):
         movie_sessions = self.client.get(
             f"/api/cinema/movie_sessions/?movie={self.movie.id}"
         )
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(movie_sessions.data), 1)
+        self.assertEqual(movie_sessions.data["count"], 1)
 
         movie_sessions = self.client.get(
             "/api/cinema/movie_sessions/?movie=1234"
         )
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(movie_sessions.data), 0)
+        self.assertEqual(movie_sessions.data["count"], 0)
 
     def test_get_movie_sessions_filtered_by_movie_and_data(self):
         movie_sessions = self.client.get(
             f"/api/cinema/movie_sessions/?movie={self.movie.id}&date=2022-09-2"
         )
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(movie_sessions.data), 1)
+        self.assertEqual(movie_sessions.data["count"], 1)
 
         movie_sessions = self.client.get(
             "/api/cinema/movie_sessions/?movie=1234&date=2022-09-2"
         )
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(movie_sessions.data), 0)
+        self.assertEqual(movie_sessions.data["count"], 0)
 
         movie_sessions = self.client.get(
             f"/api/cinema/movie_sessions/?movie={self.movie.id}&date=2022-09-3"
         )
         self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(movie_sessions.data), 0)
+        self.assertEqual(movie_sessions.data["count"], 0)
 
     def test_post_movie_session(self):
         movies = self.client.post(
@@ -127,3 +127,66 @@ class MovieSessionApiTests(TestCase):
         self.assertEqual(response.data["cinema_hall"]["rows"], 10)
         self.assertEqual(response.data["cinema_hall"]["seats_in_row"], 14)
         self.assertEqual(response.data["cinema_hall"]["name"], "White")
+
+    def test_get_movie_sessions_filtered_by_invalid_movie(self):
+        movie_sessions = self.client.get(
+            "/api/cinema/movie_sessions/?movie=abc"
+        )
+        self.assertEqual(
+            movie_sessions.status_code, status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_get_movie_sessions_num_queries(self):
+        MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime.datetime(year=2022, month=9, day=3, hour=9),
+        )
+        # count, sessions joined with movie and cinema hall
+        with self.assertNumQueries(2):
+            self.client.get("/api/cinema/movie_sessions/")
+
+    def test_get_movie_session_num_queries(self):
+        # session joined with movie and cinema hall,
+        # prefetched movie genres, prefetched movie actors
+        with self.assertNumQueries(3):
+            self.client.get(
+                f"/api/cinema/movie_sessions/{self.movie_session.id}/"
+            )
+
+    def test_get_movie_sessions_filtered_by_date_boundaries(self):
+        late_session = MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime.datetime(
+                year=2022, month=9, day=2, hour=23, minute=30
+            ),
+        )
+        MovieSession.objects.create(
+            movie=self.movie,
+            cinema_hall=self.cinema_hall,
+            show_time=datetime.datetime(year=2022, month=9, day=3),
+        )
+        movie_sessions = self.client.get(
+            "/api/cinema/movie_sessions/?date=2022-09-02"
+        )
+        self.assertEqual(movie_sessions.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            {session["id"] for session in movie_sessions.data["results"]},
+            {self.movie_session.id, late_session.id},
+        )
+
+    def test_get_movie_sessions_filtered_by_invalid_date(self):
+        movie_sessions = self.client.get(
+            "/api/cinema/movie_sessions/?date=bad"
+        )
+        self.assertEqual(
+            movie_sessions.status_code, status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_get_movie_session_without_tickets(self):
+        response = self.client.get(
+            f"/api/cinema/movie_sessions/{self.movie_session.id}/"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["taken_places"], [])
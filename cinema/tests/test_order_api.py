@@ -1,4 +1,5 @@
 from datetime import datetime
+from unittest import mock
 
 from django.test import TestCase
 
@@ -14,6 +15,7 @@ from cinema.models import (
     Ticket,
     Order,
 )
+from cinema.serializers import OrderSerializer
 from user.models import User
 
 
@@ -84,6 +86,117 @@ class OrderApiTests(TestCase):
         response = self.client.get(f"/api/cinema/movie_sessions/")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(
-            response.data[0]["tickets_available"],
+            response.data["results"][0]["tickets_available"],
             self.cinema_hall.capacity - 1,
         )
+
+    def _tickets_payload(self, *places):
+        return {
+            "tickets": [
+                {
+                    "row": row,
+                    "seat": seat,
+                    "movie_session": self.movie_session.id,
+                }
+                for row, seat in places
+            ]
+        }
+
+    def test_create_order_with_taken_seats(self):
+        self.client.force_authenticate(user=self.user)
+        Ticket.objects.create(
+            movie_session=self.movie_session, row=3, seat=4, order=self.order
+        )
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self._tickets_payload((2, 12), (3, 4), (5, 5)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(len(response.data["tickets"]), 2)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_create_order_with_same_seat_twice(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self._tickets_payload((5, 5), (5, 5)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_create_order_checks_taken_seats_in_one_query(self):
+        self.client.force_authenticate(user=self.user)
+        # 3 movie session lookups, 1 taken seats check, savepoint,
+        # order insert, tickets bulk insert, release, tickets in response
+        with self.assertNumQueries(9):
+            response = self.client.post(
+                "/api/cinema/orders/",
+                self._tickets_payload((5, 1), (5, 2), (5, 3)),
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data["tickets"]), 3)
+
+    def test_create_order_with_concurrently_taken_seat(self):
+        self.client.force_authenticate(user=self.user)
+        with mock.patch.object(
+            OrderSerializer, "validate", lambda serializer, attrs: attrs
+        ):
+            response = self.client.post(
+                "/api/cinema/orders/",
+                self._tickets_payload((2, 12)),
+                format="json",
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_create_order(self):
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self._tickets_payload((1, 1), (1, 2)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        order = Order.objects.get(id=response.data["id"])
+        self.assertEqual(order.user, self.user)
+        tickets = response.data["tickets"]
+        self.assertEqual(
+            [(ticket["row"], ticket["seat"]) for ticket in tickets],
+            [(1, 1), (1, 2)],
+        )
+        self.assertEqual(order.tickets.count(), 2)
+
+    def test_create_order_with_seat_out_of_hall_range(self):
+        self.client.force_authenticate(user=self.user)
+        for row, seat in [(11, 1), (1, 15), (0, 1)]:
+            response = self.client.post(
+                "/api/cinema/orders/",
+                self._tickets_payload((row, seat)),
+                format="json",
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
+        self.assertEqual(Order.objects.count(), 1)
+
+    def test_orders_require_authentication(self):
+        response = self.client.get("/api/cinema/orders/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        response = self.client.post(
+            "/api/cinema/orders/",
+            self._tickets_payload((1, 1)),
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_get_orders_of_authenticated_user_only(self):
+        other_user = User.objects.create(username="other")
+        other_order = Order.objects.create(user=other_user)
+        self.client.force_authenticate(user=other_user)
+        response = self.client.get("/api/cinema/orders/")
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(response.data["results"][0]["id"], other_order.id)
+        self.assertEqual(response.data["results"][0]["tickets"], [])
@@ -1,6 +1,33 @@
-from rest_framework import viewsets
+from datetime import datetime, timedelta
 
-from cinema.models import Genre, Actor, CinemaHall, Movie, MovieSession
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import (
+    Count,
+    Exists,
+    F,
+    JSONField,
+    OuterRef,
+    Prefetch,
+    Subquery,
+    Value,
+)
+from django.db.models.functions import Coalesce, JSONObject
+from rest_framework import mixins, serializers, viewsets
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+
+from cinema.models import (
+    Genre,
+    Actor,
+    CinemaHall,
+    Movie,
+    MovieSession,
+    Order,
+    Ticket,
+    JSONGroupArray,
+)
 
 from cinema.serializers import (
     GenreSerializer,
@@ -12,9 +39,82 @@ from cinema.serializers import (
     MovieDetailSerializer,
     MovieSessionDetailSerializer,
     MovieListSerializer,
+    OrderSerializer,
+    orders_serialize,
 )
 
 
+def _walk_sources(serializer, model, prefix="", in_prefetch=False):
+    select_related, prefetch_related = set(), set()
+
+    for field in serializer.fields.values():
+        if field.source == "*":
+            continue
+        if (
+            isinstance(field, serializers.RelatedField)
+            and field.use_pk_only_optimization()
+        ):
+            continue
+
+        related_model = model
+        path = prefix
+        is_prefetch = in_prefetch
+        for attr in field.source_attrs:
+            try:
+                model_field = related_model._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break
+            if not model_field.is_relation:
+                break
+
+            path = f"{path}__{attr}" if path else attr
+            is_prefetch = is_prefetch or (
+                model_field.many_to_many or model_field.one_to_many
+            )
+            (prefetch_related if is_prefetch else select_related).add(path)
+            related_model = model_field.related_model
+        else:
+            nested = getattr(field, "child", field)
+            if path != prefix and isinstance(
+                nested, serializers.BaseSerializer
+            ):
+                nested_select, nested_prefetch = _walk_sources(
+                    nested, related_model, path, is_prefetch
+                )
+                select_related |= nested_select
+                prefetch_related |= nested_prefetch
+
+    return select_related, prefetch_related
+
+
+class AutoOptimizeMixin:
+    prefetch_querysets = {}
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == "destroy":
+            return queryset
+
+        select_related, prefetch_related = _walk_sources(
+            self.get_serializer(), queryset.model
+        )
+        prefetch_lookups = [
+            Prefetch(lookup, queryset=self.prefetch_querysets[lookup].all())
+            if lookup in self.prefetch_querysets
+            else lookup
+            for lookup in sorted(prefetch_related)
+        ]
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        return queryset.prefetch_related(*prefetch_lookups)
+
+
+class StandardResultsPagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
 class GenreViewSet(viewsets.ModelViewSet):
     queryset = Genre.objects.all()
     serializer_class = GenreSerializer
@@ -30,9 +130,57 @@ class CinemaHallViewSet(viewsets.ModelViewSet):
     serializer_class = CinemaHallSerializer
 
 
-class MovieViewSet(viewsets.ModelViewSet):
+class MovieViewSet(AutoOptimizeMixin, viewsets.ModelViewSet):
     queryset = Movie.objects.all()
     serializer_class = MovieSerializer
+    pagination_class = StandardResultsPagination
+    prefetch_querysets = {
+        "genres": Genre.objects.only("id", "name"),
+        "actors": Actor.objects.only("id", "first_name", "last_name"),
+    }
+
+    @staticmethod
+    def _params_to_ints(
+        query_string: str, param_name: str
+    ) -> tuple[int, ...]:
+        try:
+            return tuple(map(int, query_string.split(",")))
+        except ValueError:
+            raise ValidationError(
+                {param_name: "Must be a comma-separated list of integer ids."}
+            )
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        title = self.request.query_params.get("title")
+        actors = self.request.query_params.get("actors")
+        genres = self.request.query_params.get("genres")
+
+        if title:
+            queryset = queryset.filter(title__icontains=title)
+
+        if actors:
+            actors_ids = self._params_to_ints(actors, "actors")
+            queryset = queryset.filter(
+                Exists(
+                    Movie.actors.through.objects.filter(
+                        movie_id=OuterRef("pk"), actor_id__in=actors_ids
+                    )
+                )
+            )
+
+        if genres:
+            genres_ids = self._params_to_ints(genres, "genres")
+            queryset = queryset.filter(
+                Exists(
+                    Movie.genres.through.objects.filter(
+                        movie_id=OuterRef("pk"), genre_id__in=genres_ids
+                    )
+                )
+            )
+
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -44,9 +192,74 @@ class MovieViewSet(viewsets.ModelViewSet):
         return MovieSerializer
 
 
-class MovieSessionViewSet(viewsets.ModelViewSet):
+class MovieSessionViewSet(AutoOptimizeMixin, viewsets.ModelViewSet):
     queryset = MovieSession.objects.all()
     serializer_class = MovieSessionSerializer
+    pagination_class = StandardResultsPagination
+    prefetch_querysets = {
+        "movie__genres": Genre.objects.only("id", "name"),
+        "movie__actors": Actor.objects.only("id", "first_name", "last_name"),
+    }
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        date = self.request.query_params.get("date")
+        movie = self.request.query_params.get("movie")
+
+        if date:
+            try:
+                day = datetime.strptime(date, "%Y-%m-%d")
+            except ValueError:
+                raise ValidationError(
+                    {"date": "Date must be in year-month-day format."}
+                )
+            queryset = queryset.filter(
+                show_time__gte=day, show_time__lt=day + timedelta(days=1)
+            )
+
+        if movie:
+            try:
+                movie_id = int(movie)
+            except ValueError:
+                raise ValidationError(
+                    {"movie": "Movie must be an integer id."}
+                )
+            queryset = queryset.filter(movie_id=movie_id)
+
+        if self.action == "list":
+            taken_places = (
+                Ticket.objects.filter(movie_session=OuterRef("pk"))
+                .order_by()
+                .values("movie_session")
+                .annotate(count=Count("id"))
+                .values("count")
+            )
+            queryset = queryset.annotate(
+                tickets_available=(
+                    F("cinema_hall__rows") * F("cinema_hall__seats_in_row")
+                    - Coalesce(Subquery(taken_places), 0)
+                )
+            )
+
+        if self.action == "retrieve":
+            taken_places = (
+                Ticket.objects.filter(movie_session=OuterRef("pk"))
+                .order_by()
+                .values("movie_session")
+                .annotate(
+                    places=JSONGroupArray(JSONObject(row="row", seat="seat"))
+                )
+                .values("places")
+            )
+            queryset = queryset.annotate(
+                taken_places=Coalesce(
+                    Subquery(taken_places),
+                    Value([], output_field=JSONField()),
+                )
+            )
+
+        return queryset
 
     def get_serializer_class(self):
         if self.action == "list":
@@ -56,3 +269,35 @@ class MovieSessionViewSet(viewsets.ModelViewSet):
             return MovieSessionDetailSerializer
 
         return MovieSessionSerializer
+
+
+class OrderViewSetPagination(PageNumberPagination):
+    page_size = 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class OrderViewSet(
+    mixins.ListModelMixin,
+    mixins.CreateModelMixin,
+    viewsets.GenericViewSet,
+):
+    queryset = Order.objects.all()
+    serializer_class = OrderSerializer
+    pagination_class = OrderViewSetPagination
+    permission_classes = (IsAuthenticated,)
+
+    def get_queryset(self):
+        return super().get_queryset().filter(user=self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(orders_serialize(page))
+
+        return Response(orders_serialize(queryset))
+
+    def perform_create(self, serializer):
+        serializer.save(user=self.request.user)